@@ -78,11 +78,13 @@ def main():
         logging.critical(
             "Помилка ініціалізації компонентів: %s", e, exc_info=True
         )
-        notifier = None  # Визначаємо змінну для уникнення помилки
         return
 
     # 5. Запуск бота
-    engine.run()
+    try:
+        engine.run()
+    finally:
+        notifier.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,260 @@
+# tests/test_engine.py
+# Автоматичні тести для модуля Engine.
+"""Автоматичні тести для модуля Engine."""
+# pylint: disable=redefined-outer-name,protected-access
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+import pytest
+
+from binance.exceptions import BinanceRequestException
+
+from trading_bot.engine import Engine
+from trading_bot.exchange_connector import BinanceFuturesConnector
+from trading_bot.journal import TradingJournal
+from trading_bot.notifications import TelegramNotifier
+from trading_bot.plan_parser import PlanParser, TradingPlan
+
+
+def make_plan(
+    trade_phases: dict, plan_date: str = "2025-07-28"
+) -> TradingPlan:
+    """Створює мінімальний валідний план із заданими фазами."""
+    return TradingPlan.model_validate({
+        "plan_date": plan_date, "plan_version": "1.0", "plan_type": "test",
+        "risk_budget": 0.01,
+        "global_settings": {
+            "max_portfolio_risk": 2.0,
+            "emergency_stop_loss": -8.0,
+            "daily_profit_target": 5.0,
+            "max_concurrent_positions": 1
+        },
+        "active_assets": [],
+        "trade_phases": trade_phases,
+        "risk_triggers": {},
+        "end_of_day_checklist": []
+    })
+
+
+@pytest.fixture
+def mock_exchange_connector():
+    """Створює мок-об'єкт для BinanceFuturesConnector."""
+    return MagicMock(spec=BinanceFuturesConnector)
+
+
+@pytest.fixture
+def engine(mock_exchange_connector):
+    """Створює Engine з мок-об'єктами залежностей."""
+    return Engine(
+        plan_parser=MagicMock(spec=PlanParser),
+        exchange_connector=mock_exchange_connector,
+        notifier=MagicMock(spec=TelegramNotifier),
+        journal=MagicMock(spec=TradingJournal)
+    )
+
+
+class TestMonitorOcoOrders:
+    """
+    Групує тести пакетної перевірки OCO-пар.
+    """
+    @pytest.fixture(autouse=True)
+    def two_oco_pairs(self, engine):
+        """Додає дві активні OCO-пари, щоб спрацював пакетний запит."""
+        engine.oco_orders = {
+            "BTCUSDT": {
+                'buy_order_id': 1, 'sell_order_id': 2, 'is_active': True
+            },
+            "ETHUSDT": {
+                'buy_order_id': 3, 'sell_order_id': 4, 'is_active': True
+            }
+        }
+
+    def test_filled_leg_cancels_other_leg(
+        self, engine, mock_exchange_connector
+    ):
+        """
+        Перевіряє, що за одним запитом відкритих ордерів скасовується
+        друга частина лише тієї пари, одна частина якої спрацювала.
+        """
+        # Arrange
+        mock_exchange_connector.get_open_orders.return_value = [
+            {"symbol": "BTCUSDT", "orderId": 1},
+            {"symbol": "BTCUSDT", "orderId": 2},
+            {"symbol": "ETHUSDT", "orderId": 4}
+        ]
+
+        # Act
+        engine._monitor_oco_orders()
+
+        # Assert
+        mock_exchange_connector.get_open_orders.assert_called_once_with()
+        mock_exchange_connector.cancel_order.assert_called_once_with(
+            "ETHUSDT", 4
+        )
+        assert list(engine.oco_orders) == ["BTCUSDT"]
+
+    def test_failed_request_keeps_pairs(
+        self, engine, mock_exchange_connector
+    ):
+        """
+        Перевіряє, що невдалий запит відкритих ордерів не видаляє OCO-пари
+        і нічого не скасовує.
+        """
+        # Arrange
+        mock_exchange_connector.get_open_orders.return_value = None
+
+        # Act
+        engine._monitor_oco_orders()
+
+        # Assert
+        mock_exchange_connector.cancel_order.assert_not_called()
+        assert set(engine.oco_orders) == {"BTCUSDT", "ETHUSDT"}
+
+    def test_request_exception_keeps_pairs(
+        self, engine, mock_exchange_connector
+    ):
+        """
+        Перевіряє, що мережева помилка пакетного запиту не зупиняє такт
+        винятком і не видаляє OCO-пари.
+        """
+        # Arrange
+        mock_exchange_connector.get_open_orders.side_effect = \
+            BinanceRequestException("timeout")
+
+        # Act
+        engine._monitor_oco_orders()
+
+        # Assert
+        mock_exchange_connector.cancel_order.assert_not_called()
+        assert set(engine.oco_orders) == {"BTCUSDT", "ETHUSDT"}
+
+
+class TestTradePhases:
+    """
+    Групує тести розкладу торгових фаз.
+    """
+    def test_same_minute_phases_run_in_plan_order(self, engine):
+        """
+        Перевіряє, що фази з однаковим часом виконуються в порядку плану,
+        а не за алфавітом назв.
+        """
+        # Arrange
+        engine.plan = make_plan({
+            "z_place": {
+                "action": "place_all_orders", "time": "10:00",
+                "description": "-"
+            },
+            "a_cancel": {
+                "action": "cancel_all_untriggered", "time": "10:00",
+                "description": "-"
+            }
+        })
+        calls = MagicMock()
+        engine._handle_place_all_orders = calls.place
+        engine._handle_cancel_all_untriggered = calls.cancel
+        engine.phase_schedule = engine._build_phase_schedule()
+
+        # Act
+        # 10:00 за Києвом улітку (UTC+3) — це 07:00 UTC
+        engine._process_trade_phases(
+            datetime(2025, 7, 28, 7, 0, 30, tzinfo=timezone.utc)
+        )
+
+        # Assert
+        assert [c[0] for c in calls.mock_calls] == ["place", "cancel"]
+
+    def test_schedule_converts_kyiv_time_on_dst_change_day(self, engine):
+        """
+        Перевіряє переведення часу фаз у UTC у день переходу на літній час
+        (30.03.2025 о 03:00 Київ переходить з UTC+2 на UTC+3).
+        """
+        # Arrange
+        engine.plan = make_plan({
+            "before": {"action": "a", "time": "02:00", "description": "-"},
+            "after": {"action": "b", "time": "10:00", "description": "-"}
+        }, plan_date="2025-03-30")
+
+        # Act
+        schedule = engine._build_phase_schedule()
+
+        # Assert
+        minutes = {name: minute for minute, _, name in schedule}
+        expected_before = datetime(2025, 3, 30, 0, 0, tzinfo=timezone.utc)
+        expected_after = datetime(2025, 3, 30, 7, 0, tzinfo=timezone.utc)
+        assert minutes == {
+            "before": int(expected_before.timestamp()) // 60,
+            "after": int(expected_after.timestamp()) // 60
+        }
+
+    def test_schedule_skips_missing_and_malformed_time(self, engine):
+        """
+        Перевіряє, що фази без часу або з некоректним часом не потрапляють
+        до розкладу, а решта фаз — потрапляють.
+        """
+        # Arrange
+        engine.plan = make_plan({
+            "no_time": {"action": "a", "description": "-"},
+            "no_colon": {"action": "a", "time": "1000", "description": "-"},
+            "not_numbers": {
+                "action": "a", "time": "ab:cd", "description": "-"
+            },
+            "valid": {"action": "a", "start_time": "12:30", "description": "-"}
+        })
+
+        # Act
+        schedule = engine._build_phase_schedule()
+
+        # Assert
+        assert [name for _, _, name in schedule] == ["valid"]
+
+    def test_past_due_phase_is_dropped(self, engine):
+        """
+        Перевіряє, що фаза, хвилина якої вже минула, не виконується
+        і видаляється з розкладу.
+        """
+        # Arrange
+        engine.plan = make_plan({
+            "place": {
+                "action": "place_all_orders", "time": "10:00",
+                "description": "-"
+            }
+        })
+        engine._handle_place_all_orders = MagicMock()
+        engine.phase_schedule = engine._build_phase_schedule()
+
+        # Act
+        engine._process_trade_phases(
+            datetime(2025, 7, 28, 7, 5, tzinfo=timezone.utc)
+        )
+
+        # Assert
+        engine._handle_place_all_orders.assert_not_called()
+        assert not engine.phase_schedule
+
+    def test_due_phase_runs_its_handler_once(self, engine):
+        """
+        Перевіряє, що фаза викликає обробник своєї дії рівно один раз,
+        навіть якщо в її хвилині відбулося кілька тактів.
+        """
+        # Arrange
+        engine.plan = make_plan({
+            "cancel": {
+                "action": "cancel_all_untriggered", "time": "10:00",
+                "description": "-"
+            }
+        })
+        engine._handle_cancel_all_untriggered = MagicMock()
+        engine._handle_place_all_orders = MagicMock()
+        engine.phase_schedule = engine._build_phase_schedule()
+
+        # Act
+        engine._process_trade_phases(
+            datetime(2025, 7, 28, 7, 0, 10, tzinfo=timezone.utc)
+        )
+        engine._process_trade_phases(
+            datetime(2025, 7, 28, 7, 0, 40, tzinfo=timezone.utc)
+        )
+
+        # Assert
+        engine._handle_cancel_all_untriggered.assert_called_once_with()
+        engine._handle_place_all_orders.assert_not_called()
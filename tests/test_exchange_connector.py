@@ -0,0 +1,192 @@
+# tests/test_exchange_connector.py
+# Автоматичні тести для модуля BinanceFuturesConnector.
+"""Автоматичні тести для модуля BinanceFuturesConnector."""
+# pylint: disable=redefined-outer-name
+
+from unittest.mock import patch
+import pytest
+
+from trading_bot.exchange_connector import (
+    BinanceFuturesConnector, PRICE_CACHE_TTL
+)
+
+# --- Тестові дані ---
+
+EXCHANGE_INFO = {
+    "symbols": [
+        {
+            "symbol": "LDOUSDT",
+            "filters": [
+                {"filterType": "LOT_SIZE", "minQty": "0.1", "stepSize": "0.1"},
+                {"filterType": "PRICE_FILTER", "tickSize": "0.0001"}
+            ]
+        },
+        {
+            "symbol": "BTCUSDT",
+            "filters": [
+                {"filterType": "LOT_SIZE", "minQty": "0.001",
+                 "stepSize": "0.001"}
+            ]
+        }
+    ]
+}
+
+
+@pytest.fixture
+def client_cls():
+    """Підміняє клієнт Binance мок-об'єктом."""
+    with patch("trading_bot.exchange_connector.Client") as mock_cls:
+        client = mock_cls.return_value
+        client.futures_exchange_info.return_value = EXCHANGE_INFO
+        yield mock_cls
+
+
+@pytest.fixture
+def connector(client_cls, tmp_path):
+    """Створює конектор з мок-клієнтом та кешем у тимчасовій папці."""
+    # pylint: disable=unused-argument
+    return BinanceFuturesConnector(
+        api_key="key", api_secret="secret", testnet=True,
+        cache_dir=str(tmp_path)
+    )
+
+
+# --- Тести ---
+
+
+def test_get_exchange_filters_returns_filters_by_type(connector):
+    """
+    Перевіряє, що фільтри символу повертаються у вигляді словника
+    з ключами filterType.
+    """
+    # Act
+    filters = connector.get_exchange_filters("LDOUSDT")
+
+    # Assert
+    assert filters["LOT_SIZE"]["stepSize"] == "0.1"
+    assert filters["PRICE_FILTER"]["tickSize"] == "0.0001"
+
+
+def test_get_exchange_filters_unknown_symbol(connector):
+    """Перевіряє, що для невідомого символу повертається порожній словник."""
+    assert connector.get_exchange_filters("UNKNOWNUSDT") == {}
+
+
+def test_get_exchange_filters_fetches_exchange_info_once(connector):
+    """
+    Перевіряє, що futures_exchange_info запитується лише один раз
+    для послідовних викликів.
+    """
+    # Act
+    connector.get_exchange_filters("LDOUSDT")
+    connector.get_exchange_filters("BTCUSDT")
+    connector.get_exchange_filters("LDOUSDT")
+
+    # Assert
+    connector.client.futures_exchange_info.assert_called_once()
+
+
+def test_get_exchange_filters_uses_disk_cache(client_cls, tmp_path):
+    """
+    Перевіряє, що новий конектор читає exchange info з файлового кешу,
+    не звертаючись до біржі.
+    """
+    # Arrange: перший конектор завантажує дані з біржі та створює кеш
+    first = BinanceFuturesConnector(
+        api_key="key", api_secret="secret", testnet=True,
+        cache_dir=str(tmp_path)
+    )
+    first.get_exchange_filters("LDOUSDT")
+    client_cls.return_value.futures_exchange_info.reset_mock()
+
+    # Act
+    second = BinanceFuturesConnector(
+        api_key="key", api_secret="secret", testnet=True,
+        cache_dir=str(tmp_path)
+    )
+    filters = second.get_exchange_filters("BTCUSDT")
+
+    # Assert
+    assert filters["LOT_SIZE"]["stepSize"] == "0.001"
+    client_cls.return_value.futures_exchange_info.assert_not_called()
+
+
+def test_get_current_prices_single_request(connector):
+    """
+    Перевіряє, що ціни кількох символів отримуються одним запитом
+    і відфільтровуються за списком символів.
+    """
+    # Arrange
+    connector.client.futures_symbol_ticker.return_value = [
+        {"symbol": "BTCUSDT", "price": "60000.5"},
+        {"symbol": "ETHUSDT", "price": "3000.25"},
+        {"symbol": "LDOUSDT", "price": "1.142"}
+    ]
+
+    # Act
+    prices = connector.get_current_prices(["BTCUSDT", "ETHUSDT", "XYZUSDT"])
+
+    # Assert
+    assert prices == {"BTCUSDT": 60000.5, "ETHUSDT": 3000.25}
+    connector.client.futures_symbol_ticker.assert_called_once_with()
+    # Пакетні ціни обслуговують наступні одиночні запити з кешу
+    assert connector.get_current_price("BTCUSDT") == 60000.5
+    connector.client.futures_ticker.assert_not_called()
+
+
+def test_get_funding_rates_single_request(connector):
+    """
+    Перевіряє, що funding rate кількох символів отримується одним запитом
+    premiumIndex і обслуговує наступні одиночні запити з кешу.
+    """
+    # Arrange
+    connector.client.futures_mark_price.return_value = [
+        {"symbol": "BTCUSDT", "markPrice": "60000.0",
+         "lastFundingRate": "0.0001"},
+        {"symbol": "ETHUSDT", "markPrice": "3000.0",
+         "lastFundingRate": "-0.0002"}
+    ]
+
+    # Act
+    rates = connector.get_funding_rates_and_mark_prices(["ETHUSDT"])
+
+    # Assert
+    assert rates == {
+        "ETHUSDT": {"markPrice": 3000.0, "lastFundingRate": -0.0002}
+    }
+    connector.client.futures_mark_price.assert_called_once_with()
+    assert connector.get_funding_rate_and_mark_price("ETHUSDT") == \
+        rates["ETHUSDT"]
+    connector.client.futures_premium_index.assert_not_called()
+
+
+def test_get_current_price_uses_cache_within_ttl(connector):
+    """
+    Перевіряє, що повторний запит ціни в межах TTL не звертається до біржі,
+    а після закінчення TTL ціна запитується знову.
+    """
+    # Arrange
+    connector.client.futures_ticker.return_value = {"lastPrice": "1.5"}
+
+    # Act & Assert
+    with patch("trading_bot.exchange_connector._monotonic") as clock:
+        clock.return_value = 100.0
+        assert connector.get_current_price("LDOUSDT") == 1.5
+        clock.return_value = 100.0 + PRICE_CACHE_TTL / 2
+        assert connector.get_current_price("LDOUSDT") == 1.5
+        connector.client.futures_ticker.assert_called_once()
+
+        clock.return_value = 100.0 + PRICE_CACHE_TTL + 1
+        connector.get_current_price("LDOUSDT")
+        assert connector.client.futures_ticker.call_count == 2
+
+
+def test_cancel_all_orders_single_request(connector):
+    """Перевіряє, що всі ордери символу скасовуються одним запитом."""
+    # Act
+    connector.cancel_all_orders("LDOUSDT")
+
+    # Assert
+    connector.client.futures_cancel_all_open_orders.assert_called_once_with(
+        symbol="LDOUSDT"
+    )
@@ -0,0 +1,121 @@
+# tests/test_notifications.py
+# Автоматичні тести для модуля TelegramNotifier.
+"""Автоматичні тести для модуля TelegramNotifier."""
+# pylint: disable=redefined-outer-name
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+import pytest
+from telegram.error import RetryAfter, TimedOut
+
+from trading_bot.notifications import TelegramNotifier, SEND_ATTEMPTS
+
+
+@pytest.fixture
+def bot():
+    """Підміняє telegram.Bot мок-об'єктом з асинхронними методами."""
+    with patch("trading_bot.notifications.telegram.Bot") as mock_cls:
+        instance = mock_cls.return_value
+        instance.send_message = AsyncMock()
+        instance.shutdown = AsyncMock()
+        yield instance
+
+
+def test_messages_within_window_are_coalesced(bot):
+    """
+    Перевіряє, що повідомлення, надіслані одне за одним, доставляються
+    одним запитом до Telegram у порядку надходження.
+    """
+    # Arrange
+    notifier = TelegramNotifier(token="token", chat_id="chat")
+
+    # Act
+    notifier.send_message("Перше", level="info")
+    notifier.send_message("Друге", level="trade")
+    notifier.close()
+
+    # Assert
+    bot.send_message.assert_awaited_once()
+    text = bot.send_message.await_args.kwargs["text"]
+    assert text.index("Перше") < text.index("Друге")
+    bot.shutdown.assert_awaited_once()
+
+
+def test_disabled_without_token():
+    """Перевіряє, що без токена нотифікатор нічого не надсилає."""
+    # Arrange
+    notifier = TelegramNotifier(token="", chat_id="")
+
+    # Act
+    notifier.send_message("Тест")
+    notifier.close()
+
+    # Assert
+    assert notifier.bot is None
+
+
+def test_retry_after_flood_limit(bot):
+    """
+    Перевіряє, що після відповіді 429 (RetryAfter) повідомлення
+    надсилається повторно.
+    """
+    # Arrange
+    bot.send_message.side_effect = [RetryAfter(0), None]
+    notifier = TelegramNotifier(token="token", chat_id="chat")
+
+    # Act
+    notifier.send_message("Тест", level="critical")
+    notifier.close()
+
+    # Assert
+    assert bot.send_message.await_count == 2
+
+
+def test_retry_after_as_timedelta(bot, monkeypatch):
+    """
+    Перевіряє, що RetryAfter з інтервалом у вигляді timedelta також
+    призводить до повторного надсилання.
+    """
+    # Arrange
+    monkeypatch.setenv("PTB_TIMEDELTA", "true")
+    bot.send_message.side_effect = [RetryAfter(timedelta(0)), None]
+    notifier = TelegramNotifier(token="token", chat_id="chat")
+
+    # Act
+    notifier.send_message("Тест", level="critical")
+    notifier.close()
+
+    # Assert
+    assert bot.send_message.await_count == 2
+
+
+def test_network_errors_are_retried_with_limit(bot):
+    """
+    Перевіряє, що при тайм-аутах надсилання повторюється не більше
+    SEND_ATTEMPTS разів.
+    """
+    # Arrange
+    bot.send_message.side_effect = TimedOut()
+    with patch("trading_bot.notifications.SEND_RETRY_BASE_DELAY_SEC", 0):
+        notifier = TelegramNotifier(token="token", chat_id="chat")
+
+        # Act
+        notifier.send_message("Тест", level="critical")
+        notifier.close()
+
+    # Assert
+    assert bot.send_message.await_count == SEND_ATTEMPTS
+
+
+def test_text_is_escaped_for_markdown_v2(bot):
+    """Перевіряє екранування спецсимволів MARKDOWN_V2 у тексті."""
+    # Arrange
+    notifier = TelegramNotifier(token="token", chat_id="chat")
+
+    # Act
+    notifier.send_message("PnL: -1.5 (BTC_USDT)", level="critical")
+    notifier.close()
+
+    # Assert
+    text = bot.send_message.await_args.kwargs["text"]
+    assert text.endswith(r"PnL: \-1\.5 \(BTC\_USDT\)")
@@ -2,10 +2,11 @@
 # Основний рушій, який виконує торговий план.
 """Основной рушій, який виконує торговий план."""
 
+import heapq
 import logging
 import time
-from datetime import datetime, timedelta
-import pytz
+from datetime import datetime, time as dt_time, timezone
+from zoneinfo import ZoneInfo
 
 from binance.exceptions import (
     BinanceAPIException, BinanceRequestException
@@ -20,6 +21,11 @@ from trading_bot.notifications import TelegramNotifier
 from trading_bot.journal import TradingJournal
 from trading_bot.utils import calculate_atr
 
+# Часовий пояс, у якому задано час фаз торгового плану
+PLAN_TZ = ZoneInfo('Europe/Kiev')
+# Інтервал між перевірками головного циклу (секунди)
+CHECK_INTERVAL_SEC = 15
+
 
 class Engine:
     """
@@ -40,11 +46,18 @@ class Engine:
         self.journal = journal
         self.plan: TradingPlan | None = None
         self.risk_manager: RiskManager | None = None
-        self.executed_phases = set()
         self.managed_positions = {}
         self.oco_orders = {}
         self.price_tracker = {}
-        self.last_check_time = datetime.now(pytz.utc)
+        # Індекс активів плану за символом для пошуку за O(1)
+        self.assets_by_symbol: dict[str, ActiveAsset] = {}
+        # Символи хеджувальних позицій з плану
+        self.hedge_symbols: set[str] = set()
+        # Черга фаз (хвилина епохи UTC, порядок у плані, назва),
+        # див. _build_phase_schedule
+        self.phase_schedule: list[tuple[int, int, str]] = []
+        # Час останньої перевірки за монотонним годинником (time.monotonic)
+        self.last_check_time = time.monotonic()
 
     def run(self):
         """Запускає головний цикл бота."""
@@ -59,14 +72,18 @@ class Engine:
 
         try:
             while True:
-                current_utc_time = datetime.now(pytz.utc)
-                if current_utc_time - self.last_check_time > \
-                        timedelta(seconds=15):
+                # Інтервал міряємо монотонним годинником: це дешевше за
+                # datetime і не залежить від корекцій системного часу
+                now = time.monotonic()
+                if now - self.last_check_time > CHECK_INTERVAL_SEC:
+                    current_utc_time = datetime.now(timezone.utc)
                     self._process_trade_phases(current_utc_time)
                     self._monitor_oco_orders()
+                    self._refresh_prices()
+                    self._refresh_funding_rates()
                     self._manage_open_positions()
                     self._check_global_risks(current_utc_time)
-                    self.last_check_time = current_utc_time
+                    self.last_check_time = now
                 time.sleep(1)
         except KeyboardInterrupt:
             self.logger.info(
@@ -93,6 +110,22 @@ class Engine:
             notifier=self.notifier, journal=self.journal
         )
         self.risk_manager.update_equity()
+        self.assets_by_symbol = {
+            asset.symbol: asset for asset in self.plan.active_assets
+        }
+        self.hedge_symbols = {
+            asset.hedge.symbol for asset in self.plan.active_assets
+            if asset.hedge
+        }
+        # Завантажуємо правила торгівлі заздалегідь, щоб у момент
+        # розміщення ордерів розрахунок розміру не чекав на біржу
+        for symbol in self.assets_by_symbol:
+            if not self.exchange.get_exchange_filters(symbol):
+                self.logger.warning(
+                    "Не знайдено фільтрів біржі для %s. Ордери для цього "
+                    "активу не будуть розміщені.", symbol
+                )
+        self.phase_schedule = self._build_phase_schedule()
         self.logger.info(
             "Бот працюватиме за планом: %s - %s",
             self.plan.plan_date, self.plan.plan_type
@@ -104,14 +137,30 @@ class Engine:
         )
         return True
 
-    def _process_trade_phases(self, current_utc_time: datetime):
-        """Обробляє часові фази з торгового плану."""
+    def _build_phase_schedule(self) -> list[tuple[int, int, str]]:
+        """
+        Один раз переводить час кожної фази плану в хвилину епохи UTC
+        та складає з них мін-купу, щоб головний цикл перевіряв лише
+        найближчу фазу. Фази з однаковою хвилиною виконуються в порядку
+        плану.
+        """
+        schedule: list[tuple[int, int, str]] = []
         if not self.plan:
-            return
-        for phase_name, phase_details in self.plan.trade_phases.items():
-            if phase_name in self.executed_phases:
-                continue
+            return schedule
 
+        try:
+            plan_date = datetime.strptime(
+                self.plan.plan_date, "%Y-%m-%d"
+            ).date()
+        except ValueError as e:
+            self.logger.error(
+                "Некоректна дата плану '%s': %s", self.plan.plan_date, e
+            )
+            return schedule
+
+        for plan_index, (phase_name, phase_details) in enumerate(
+            self.plan.trade_phases.items()
+        ):
             # Підтримка обох форматів: time та start_time
             phase_time_str = phase_details.time or phase_details.start_time
             if not phase_time_str:
@@ -120,26 +169,20 @@ class Engine:
                 )
                 continue
 
-            try:
-                local_tz = pytz.timezone('Europe/Kiev')
-                plan_date = datetime.strptime(
-                    self.plan.plan_date, "%Y-%m-%d"
-                ).date()
-
-                # Парсимо час у форматі HH:MM
-                if ':' in phase_time_str:
-                    hour, minute = map(int, phase_time_str.split(':'))
-                else:
-                    self.logger.error(
-                        "Некоректний формат часу для фази '%s': %s",
-                        phase_name, phase_time_str
-                    )
-                    continue
+            # Парсимо час у форматі HH:MM
+            if ':' not in phase_time_str:
+                self.logger.error(
+                    "Некоректний формат часу для фази '%s': %s",
+                    phase_name, phase_time_str
+                )
+                continue
 
-                phase_local_time = local_tz.localize(
-                    datetime.combine(plan_date, datetime.min.time())
-                ).replace(hour=hour, minute=minute)
-                phase_utc_time = phase_local_time.astimezone(pytz.utc)
+            try:
+                hour, minute = map(int, phase_time_str.split(':'))
+                phase_local_time = datetime.combine(
+                    plan_date, dt_time(hour, minute), tzinfo=PLAN_TZ
+                )
+                phase_utc_time = phase_local_time.astimezone(timezone.utc)
             except (ValueError, TypeError) as e:
                 self.logger.error(
                     "Некоректний формат часу для фази '%s': %s",
@@ -147,27 +190,46 @@ class Engine:
                 )
                 continue
 
-            if current_utc_time.strftime('%Y-%m-%d %H:%M') == \
-               phase_utc_time.strftime('%Y-%m-%d %H:%M'):
-                self.logger.info("Настала торгова фаза: '%s'", phase_name)
-                if not phase_details.action:
-                    self.logger.error(
-                        "Для фази '%s' не вказано дію ('action') у "
-                        "торговому плані. Фазу пропущено.", phase_name
-                    )
-                    self.notifier.send_message(
-                        f"Помилка в плані: для фази '{phase_name}' "
-                        "не вказано дію.", level="critical"
-                    )
-                    self.executed_phases.add(phase_name)
-                    continue
+            schedule.append((
+                int(phase_utc_time.timestamp()) // 60, plan_index, phase_name
+            ))
+        heapq.heapify(schedule)
+        return schedule
 
-                handler_method_name = f"_handle_{phase_details.action}"
-                handler_method = getattr(
-                    self, handler_method_name, self._handle_unknown_action
+    def _process_trade_phases(self, current_utc_time: datetime):
+        """Обробляє часові фази з торгового плану."""
+        if not self.plan:
+            return
+        # Порівнюємо цілі хвилини епохи замість форматування рядків
+        current_minute = int(current_utc_time.timestamp()) // 60
+        while self.phase_schedule and \
+                self.phase_schedule[0][0] <= current_minute:
+            phase_minute, _, phase_name = heapq.heappop(self.phase_schedule)
+            if phase_minute < current_minute:
+                # Хвилина фази вже минула — така фаза не виконується
+                self.logger.debug(
+                    "Час фази '%s' минув, фазу пропущено.", phase_name
+                )
+                continue
+
+            phase_details = self.plan.trade_phases[phase_name]
+            self.logger.info("Настала торгова фаза: '%s'", phase_name)
+            if not phase_details.action:
+                self.logger.error(
+                    "Для фази '%s' не вказано дію ('action') у "
+                    "торговому плані. Фазу пропущено.", phase_name
                 )
-                handler_method()
-                self.executed_phases.add(phase_name)
+                self.notifier.send_message(
+                    f"Помилка в плані: для фази '{phase_name}' "
+                    "не вказано дію.", level="critical"
+                )
+                continue
+
+            handler_method_name = f"_handle_{phase_details.action}"
+            handler_method = getattr(
+                self, handler_method_name, self._handle_unknown_action
+            )
+            handler_method()
 
     def _should_execute_order_group(
         self, order_group: OrderGroup, current_time: datetime
@@ -193,7 +255,7 @@ class Engine:
         if not self.plan or not self.risk_manager:
             return
 
-        current_time = datetime.now(pytz.utc)
+        current_time = datetime.now(timezone.utc)
         for asset in self.plan.active_assets:
             if asset.strategy == "oco_breakout":
                 # Перевіряємо, чи час валідний для виконання ордерів
@@ -300,16 +362,49 @@ class Engine:
 
     def _monitor_oco_orders(self):
         """Перевіряє стан активних OCO-пар."""
-        if not self.oco_orders:
+        active_symbols = [
+            symbol for symbol, oco_info in self.oco_orders.items()
+            if oco_info['is_active']
+        ]
+        if not active_symbols:
             return
-        symbols_to_remove = []
-        for symbol, oco_info in list(self.oco_orders.items()):
-            if not oco_info['is_active']:
-                continue
 
+        # Для кількох OCO-пар отримуємо відкриті ордери всіх символів одним
+        # запитом замість окремого запиту на кожен символ
+        order_ids_by_symbol = None
+        if len(active_symbols) > 1:
+            try:
+                open_orders = self.exchange.get_open_orders()
+            except (BinanceAPIException, BinanceRequestException) as e:
+                self.logger.error(
+                    "Помилка при отриманні відкритих ордерів для OCO: %s", e
+                )
+                return
+            if open_orders is None:
+                # Без списку ордерів обидві частини кожної пари виглядали б
+                # неактивними; пропускаємо такт і перевіряємо наступного разу
+                self.logger.warning(
+                    "Не вдалося отримати відкриті ордери, перевірку OCO "
+                    "відкладено."
+                )
+                return
+            order_ids_by_symbol = {}
+            for order in open_orders:
+                order_ids_by_symbol.setdefault(
+                    order['symbol'], set()
+                ).add(order['orderId'])
+
+        symbols_to_remove = []
+        for symbol in active_symbols:
+            oco_info = self.oco_orders[symbol]
             try:
-                open_orders = self.exchange.get_open_orders(symbol)
-                open_order_ids = {o['orderId'] for o in open_orders}
+                if order_ids_by_symbol is None:
+                    symbol_orders = self.exchange.get_open_orders(symbol)
+                    if symbol_orders is None:
+                        continue
+                    open_order_ids = {o['orderId'] for o in symbol_orders}
+                else:
+                    open_order_ids = order_ids_by_symbol.get(symbol, set())
                 buy_active = oco_info['buy_order_id'] in open_order_ids
                 sell_active = oco_info['sell_order_id'] in open_order_ids
 
@@ -357,19 +452,11 @@ class Engine:
             p['symbol']: p for p in positions if float(p['positionAmt']) != 0
         }
         for symbol, position_data in open_positions.items():
-            # Перевіряємо, чи це не хеджувальна позиція (безпечно)
-            is_hedge_position = False
-            for asset in self.plan.active_assets:
-                if asset.hedge and symbol == asset.hedge.symbol:
-                    is_hedge_position = True
-                    break
-            if is_hedge_position:
+            # Хеджувальні позиції тут не керуються
+            if symbol in self.hedge_symbols:
                 continue
 
-            asset_plan = next(
-                (a for a in self.plan.active_assets if a.symbol == symbol),
-                None
-            )
+            asset_plan = self.assets_by_symbol.get(symbol)
             if not asset_plan:
                 continue
 
@@ -483,6 +570,7 @@ class Engine:
         funding_rule = asset_plan.monitoring_rules.get('funding_rate_pct')
         if funding_rule and 'funding_rate' not in \
                 position_state['monitoring_triggers']:
+            # Дані вже отримано пакетом у _refresh_funding_rates
             market_data = self.exchange.get_funding_rate_and_mark_price(
                 symbol
             )
@@ -511,26 +599,16 @@ class Engine:
             if not oi_data:
                 return
 
+            # Конектор уже повертає openInterest як float
             current_oi = oi_data.get('openInterest')
             if current_oi is None:
                 return
 
-            try:
-                current_oi_float = float(current_oi)
-            except (ValueError, TypeError):
-                self.logger.error(
-                    "Не вдалося перетворити OI '%s' у float для %s",
-                    current_oi, symbol
-                )
-                return
-
             last_oi = position_state.get('last_oi')
-            position_state['last_oi'] = current_oi_float
+            position_state['last_oi'] = current_oi
 
-            if last_oi is not None:
-                oi_change_pct = (
-                    (current_oi_float - last_oi) / last_oi
-                ) * 100
+            if last_oi:
+                oi_change_pct = ((current_oi - last_oi) / last_oi) * 100
                 threshold = (
                     oi_rule.threshold or oi_rule.threshold_pct or 0
                 )
@@ -606,10 +684,10 @@ class Engine:
             if is_long else
             current_price + (atr_value * dm_config.trailing_sl_atr_multiple)
         )
-        if new_sl_price is None:
-            return
 
         open_orders = self.exchange.get_open_orders(symbol)
+        if open_orders is None:
+            return
         current_sl_order = next(
             (o for o in open_orders if o['orderId'] == sl_order_id), None
         )
@@ -646,19 +724,45 @@ class Engine:
         """Скасовує всі неактивовані ордери для активних ассетів."""
         if not self.plan:
             return
+        # Один запит allOpenOrders на символ замість отримання списку
+        # ордерів та окремого скасування кожного з них
         for asset in self.plan.active_assets:
-            open_orders = self.exchange.get_open_orders(symbol=asset.symbol)
-            if not open_orders:
-                continue
-            for order in open_orders:
-                self.exchange.cancel_order(
-                    symbol=asset.symbol, order_id=order['orderId']
-                )
+            self.exchange.cancel_all_orders(asset.symbol)
 
     def _handle_unknown_action(self):
         """Обробляє невідому дію з торгового плану."""
         self.logger.warning("Спроба виконати невідому дію з торгового плану.")
 
+    def _refresh_prices(self):
+        """
+        Одним запитом оновлює кеш цін для всіх символів, ціни яких
+        знадобляться на цьому такті: керовані позиції (трейлінг-стоп)
+        та активи тригера раптового падіння.
+        """
+        if not self.plan:
+            return
+        symbols = set(self.managed_positions)
+        flash_drop = self.plan.risk_triggers.get("btc_flash_drop")
+        if flash_drop and flash_drop.assets:
+            symbols.update(flash_drop.assets)
+        if symbols:
+            self.exchange.get_current_prices(list(symbols))
+
+    def _refresh_funding_rates(self):
+        """
+        Одним запитом premiumIndex оновлює кеш funding rate для керованих
+        позицій, у плані яких є ще не спрацьоване правило funding_rate_pct.
+        """
+        symbols = []
+        for symbol, state in self.managed_positions.items():
+            asset_plan = self.assets_by_symbol.get(symbol)
+            if (asset_plan and asset_plan.monitoring_rules and
+                    'funding_rate_pct' in asset_plan.monitoring_rules and
+                    'funding_rate' not in state['monitoring_triggers']):
+                symbols.append(symbol)
+        if symbols:
+            self.exchange.get_funding_rates_and_mark_prices(symbols)
+
     def _check_global_risks(self, _: datetime):
         """Перевіряє глобальні ризики, такі як раптові падіння цін."""
         if not self.plan or not self.risk_manager:
@@ -667,6 +771,7 @@ class Engine:
             if trigger_name == "btc_flash_drop":
                 assets_to_check = trigger_details.assets or []
                 for symbol in assets_to_check:
+                    # Ціну вже отримано пакетом у _refresh_prices
                     current_price = self.exchange.get_current_price(symbol)
                     if current_price is None:
                         continue
@@ -3,12 +3,29 @@
 """Інкапсулює логіку для взаємодії з API Binance Futures."""
 
 import logging
+import os
+import time
+
+import orjson
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 from tenacity import (
     retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 )
 
+# Файловий кеш futures_exchange_info та час його життя (секунди)
+EXCHANGE_INFO_CACHE_DIR = "data/cache"
+EXCHANGE_INFO_CACHE_TTL = 24 * 60 * 60
+
+# Скільки секунд отримана ціна вважається актуальною. Має покривати
+# один такт рушія, щоб ціни, отримані пакетом на початку такту,
+# обслуговували всі подальші запити в ньому
+PRICE_CACHE_TTL = 5.0
+
+# Годинник для кешів цін і funding; окремий псевдонім дозволяє тестам
+# підмінити його лише в цьому модулі, а не time.monotonic для всього процесу
+_monotonic = time.monotonic
+
 
 class BinanceFuturesConnector:
     """
@@ -28,8 +45,23 @@ class BinanceFuturesConnector:
             ))
         )
 
-    def __init__(self, api_key: str, api_secret: str, testnet: bool = False):
+    def __init__(
+        self, api_key: str, api_secret: str, testnet: bool = False,
+        cache_dir: str = EXCHANGE_INFO_CACHE_DIR
+    ):
         self.testnet = testnet
+        self.exchange_info_cache_path = os.path.join(
+            cache_dir,
+            f"exchange_info_{'testnet' if testnet else 'mainnet'}.json"
+        )
+        # Фільтри з futures_exchange_info за символом: правила торгівлі
+        # змінюються рідко, а сама відповідь важка, тому індекс будується
+        # один раз
+        self._filters_by_symbol: dict[str, dict] | None = None
+        # Кеш цін: символ -> (_monotonic() отримання, ціна)
+        self._price_cache: dict[str, tuple[float, float]] = {}
+        # Кеш premiumIndex: символ -> (_monotonic() отримання, дані)
+        self._funding_cache: dict[str, tuple[float, dict]] = {}
         try:
             self.client = Client(api_key, api_secret, testnet=self.testnet)
             self.client.API_URL = (
@@ -53,15 +85,41 @@ class BinanceFuturesConnector:
         Цей метод інкапсулює логіку отримання фільтрів.
         """
         try:
-            info = self.client.futures_exchange_info()
-            for s in info['symbols']:
-                if s['symbol'] == symbol:
-                    filters = {f['filterType']: f for f in s['filters']}
-                    return filters
+            if self._filters_by_symbol is None:
+                info = self._load_exchange_info()
+                self._filters_by_symbol = {
+                    s['symbol']: {f['filterType']: f for f in s['filters']}
+                    for s in info['symbols']
+                }
+            return self._filters_by_symbol.get(symbol, {})
         except (BinanceAPIException, BinanceRequestException) as e:
             logging.error("Не вдалося отримати фільтри для %s: %s", symbol, e)
         return {}
 
+    def _load_exchange_info(self) -> dict:
+        """
+        Повертає futures_exchange_info з файлового кешу, якщо він свіжий,
+        інакше завантажує з біржі та оновлює кеш.
+        """
+        path = self.exchange_info_cache_path
+        try:
+            if time.time() - os.path.getmtime(path) < EXCHANGE_INFO_CACHE_TTL:
+                with open(path, "rb") as f:
+                    return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            pass  # Кешу немає або він пошкоджений — завантажуємо з біржі
+
+        info = self.client.futures_exchange_info()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(info))
+        except OSError as e:
+            logging.warning(
+                "Не вдалося зберегти кеш exchange info у %s: %s", path, e
+            )
+        return info
+
     @_retry_on_api_error()
     def check_connection(self) -> bool:
         """Перевіряє з'єднання з API та валідність ключів."""
@@ -92,7 +150,13 @@ class BinanceFuturesConnector:
 
     @_retry_on_api_error()
     def get_funding_rate_and_mark_price(self, symbol: str) -> dict | None:
-        """Отримує ставку фінансування та маркувальну ціну для символу."""
+        """
+        Отримує ставку фінансування та маркувальну ціну для символу.
+        Дані, отримані менш ніж PRICE_CACHE_TTL секунд тому, беруться з кешу.
+        """
+        cached = self._funding_cache.get(symbol)
+        if cached and _monotonic() - cached[0] < PRICE_CACHE_TTL:
+            return cached[1]
         try:
             # pylint: disable=no-member
             data = self.client.futures_premium_index(symbol=symbol)
@@ -106,6 +170,34 @@ class BinanceFuturesConnector:
             )
             return None
 
+    @_retry_on_api_error()
+    def get_funding_rates_and_mark_prices(
+        self, symbols: list[str]
+    ) -> dict[str, dict]:
+        """
+        Отримує ставки фінансування та маркувальні ціни для кількох символів
+        одним запитом premiumIndex і оновлює ними кеш.
+        """
+        try:
+            wanted = set(symbols)
+            data = self.client.futures_mark_price()
+            result = {
+                item['symbol']: {
+                    'markPrice': float(item['markPrice']),
+                    'lastFundingRate': float(item['lastFundingRate'])
+                }
+                for item in data if item['symbol'] in wanted
+            }
+            now = _monotonic()
+            for symbol, item in result.items():
+                self._funding_cache[symbol] = (now, item)
+            return result
+        except BinanceAPIException as e:
+            logging.error(
+                "Не вдалося отримати funding rate для %s: %s", symbols, e
+            )
+            return {}
+
     @_retry_on_api_error()
     def get_historical_klines(
         self, symbol: str, interval: str, limit: int = 100
@@ -140,14 +232,44 @@ class BinanceFuturesConnector:
 
     @_retry_on_api_error()
     def get_current_price(self, symbol: str) -> float | None:
-        """Отримує поточну ринкову ціну для вказаного символу."""
+        """
+        Отримує поточну ринкову ціну для вказаного символу.
+        Ціна, отримана менш ніж PRICE_CACHE_TTL секунд тому, береться з кешу.
+        """
+        cached = self._price_cache.get(symbol)
+        if cached and _monotonic() - cached[0] < PRICE_CACHE_TTL:
+            return cached[1]
         try:
             ticker = self.client.futures_ticker(symbol=symbol)
-            return float(ticker['lastPrice'])
+            price = float(ticker['lastPrice'])
+            self._price_cache[symbol] = (_monotonic(), price)
+            return price
         except BinanceAPIException as e:
             logging.error("Не вдалося отримати ціну для %s: %s", symbol, e)
             return None
 
+    @_retry_on_api_error()
+    def get_current_prices(self, symbols: list[str]) -> dict[str, float]:
+        """
+        Отримує поточні ціни для кількох символів одним запитом до біржі
+        та оновлює ними кеш цін. Символи, яких немає у відповіді біржі,
+        відсутні й у результаті.
+        """
+        try:
+            wanted = set(symbols)
+            tickers = self.client.futures_symbol_ticker()
+            prices = {
+                t['symbol']: float(t['price'])
+                for t in tickers if t['symbol'] in wanted
+            }
+            now = _monotonic()
+            for symbol, price in prices.items():
+                self._price_cache[symbol] = (now, price)
+            return prices
+        except BinanceAPIException as e:
+            logging.error("Не вдалося отримати ціни для %s: %s", symbols, e)
+            return {}
+
     def _validate_stop_order(
         self, side: str, stop_price: float, limit_price: float = None
     ):
@@ -216,6 +338,19 @@ class BinanceFuturesConnector:
             )
             return None
 
+    @_retry_on_api_error()
+    def cancel_all_orders(self, symbol: str) -> dict | None:
+        """Скасовує всі відкриті ордери для символу одним запитом."""
+        try:
+            result = self.client.futures_cancel_all_open_orders(symbol=symbol)
+            logging.info("Усі відкриті ордери для %s скасовано.", symbol)
+            return result
+        except BinanceAPIException as e:
+            logging.error(
+                "Не вдалося скасувати ордери для %s: %s", symbol, e
+            )
+            return None
+
     @_retry_on_api_error()
     def cancel_and_replace_order(
         self, symbol: str, cancel_order_id: int, side: str, order_type: str,
@@ -238,14 +373,18 @@ class BinanceFuturesConnector:
             return None
 
     @_retry_on_api_error()
-    def get_open_orders(self, symbol: str = None) -> list:
-        """Отримує список всіх відкритих ордерів."""
+    def get_open_orders(self, symbol: str = None) -> list | None:
+        """
+        Отримує список всіх відкритих ордерів.
+        Повертає None, якщо запит не вдався, щоб його не можна було
+        сплутати з відсутністю відкритих ордерів.
+        """
         try:
             params = {'symbol': symbol} if symbol else {}
             return self.client.futures_get_open_orders(**params)
         except BinanceAPIException as e:
             logging.error("Не вдалося отримати відкриті ордери: %s", e)
-            return []
+            return None
 
     @_retry_on_api_error()
     def get_position_information(self, symbol: str = None) -> list:
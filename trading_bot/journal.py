@@ -4,8 +4,13 @@
 import csv
 import logging
 import os
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
+
+# Заголовки колонок CSV-файлу журналу
+JOURNAL_HEADER = (
+    "timestamp_utc", "symbol", "side", "entry_price",
+    "exit_price", "quantity", "pnl_usdt", "reason"
+)
 
 
 class TradingJournal:
@@ -31,10 +36,7 @@ class TradingJournal:
                 with open(self.file_path, 'w', newline='',
                           encoding='utf-8') as f:
                     writer = csv.writer(f)
-                    writer.writerow([
-                        "timestamp_utc", "symbol", "side", "entry_price",
-                        "exit_price", "quantity", "pnl_usdt", "reason"
-                    ])
+                    writer.writerow(JOURNAL_HEADER)
             except IOError as e:
                 self.logger.error("Не вдалося створити файл журналу: %s", e)
 
@@ -48,7 +50,7 @@ class TradingJournal:
             with open(self.file_path, 'a', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
                 writer.writerow([
-                    datetime.now(pytz.utc).isoformat(),
+                    datetime.now(timezone.utc).isoformat(),
                     symbol,
                     side,
                     entry_price,
@@ -116,20 +118,24 @@ class TradingJournal:
         self.logger.info(
             "%s ВИКОНАННЯ ЧЕК-ЛИСТА НА КІНЕЦЬ ДНЯ %s", "="*20, "="*20
         )
-        today_str = datetime.now(pytz.utc).strftime('%Y-%m-%d')
+        today_str = datetime.now(timezone.utc).strftime('%Y-%m-%d')
 
         # 1. Розрахунок загального PnL за день з файлу журналу.
         daily_summary = self.get_daily_summary(today_str)
 
-        self.logger.info("--- Денний підсумок ---")
-        self.logger.info("Загальний PnL за %s: $%.2f",
-                         today_str, daily_summary['total_pnl'])
-        self.logger.info("Всього угод: %d", daily_summary['total_trades'])
-        self.logger.info("Прибуткових угод: %d",
-                         daily_summary['winning_trades'])
-        self.logger.info("Збиткових угод: %d", daily_summary['losing_trades'])
-        self.logger.info("Вінрейт: %.2f%%", daily_summary['win_rate'])
-        self.logger.info("--------------------")
+        # Один багаторядковий запис замість окремого запису на кожен рядок
+        self.logger.info(
+            "--- Денний підсумок ---\n"
+            "Загальний PnL за %s: $%.2f\n"
+            "Всього угод: %d\n"
+            "Прибуткових угод: %d\n"
+            "Збиткових угод: %d\n"
+            "Вінрейт: %.2f%%\n"
+            "--------------------",
+            today_str, daily_summary['total_pnl'],
+            daily_summary['total_trades'], daily_summary['winning_trades'],
+            daily_summary['losing_trades'], daily_summary['win_rate']
+        )
 
         # 2. Збереження скрін-стрічки обсягів та OI.
         self.logger.warning(
@@ -1,14 +1,35 @@
 # trading_bot/logger_config.py
 # Налаштовує централізований логер для всього проєкту.
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+
+# Фоновий потік, що передає записи з черги справжнім обробникам
+_listener: logging.handlers.QueueListener | None = None
+
+# Чи вже переналаштовано sys.stdout на UTF-8 (робиться один раз на процес)
+_console_configured = False
+
 def setup_logger() -> None:
     """
     Ініціалізує файл- та консоль-логери з UTF-8 та єдиним форматом.
+    У потоці, що логує, QueueHandler лише підставляє аргументи в
+    повідомлення (та текст винятку) і ставить запис у чергу; застосування
+    LOG_FORMAT і запис у файл та консоль виконує фоновий QueueListener.
     """
+    global _listener, _console_configured  # pylint: disable=global-statement
+    if _listener is not None:
+        _listener.stop()
+        atexit.unregister(_listener.stop)
+        for handler in _listener.handlers:
+            handler.close()
+
     # Створюємо папку для логів, якщо її не існує
     if not os.path.exists("logs"):
         os.makedirs("logs")
@@ -23,24 +44,34 @@ def setup_logger() -> None:
         "logs/trading.log",
         mode="a",
         encoding="utf-8",
+        delay=True,
     )
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    # Кодування змінюємо на самому sys.stdout: StreamHandler пише в потік
+    # як є, тож українські повідомлення не падають на консолях cp1251/cp866
+    if not _console_configured:
+        if hasattr(sys.stdout, "reconfigure"):
+            sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+        _console_configured = True
 
     # Консольний обробник
     stream_handler = logging.StreamHandler(sys.stdout)
 
-    # Безпечна зміна кодування (Python ≥ 3.10)
-    if hasattr(stream_handler, "reconfigure"):  # type: ignore[attr-defined]
-        try:
-            stream_handler.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
-        except TypeError:
-            # Деякі реалізації reconfigure не приймають encoding
-            pass
-
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
-        handlers=[file_handler, stream_handler],
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    # QueueHandler без власного формату: він лише об'єднує msg % args,
+    # а префікс LOG_FORMAT додають обробники у фоновому потоці (інакше
+    # він з'явився б у рядку двічі)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
     )
+    _listener.start()
+    # Зупиняється раніше за logging.shutdown(), тож черга встигає спорожніти
+    atexit.register(_listener.stop)
 
     # Приглушуємо «гучні» сторонні логери
     logging.getLogger("binance").setLevel(logging.WARNING)
@@ -3,8 +3,53 @@
 
 import logging
 import asyncio
+import queue
+import re
+import threading
+import time
+from datetime import timedelta
 import telegram
 from telegram.constants import ParseMode
+from telegram.error import BadRequest, NetworkError, RetryAfter
+from telegram.request import HTTPXRequest
+
+# Іконки для рівнів важливості повідомлень
+LEVEL_ICONS = {
+    "info": "ℹ️",
+    "success": "✅",
+    "warning": "⚠️",
+    "critical": "🔥",
+    "trade": "📈"
+}
+
+# Спецсимволи MARKDOWN_V2, які треба екранувати в тексті повідомлення
+_MARKDOWN_V2_ESCAPE_RE = re.compile(r"([_*\[\]()~`>#+\-=|{}.!\\])")
+
+# Готові заголовки повідомлень для кожного рівня (MARKDOWN_V2)
+LEVEL_HEADERS = {
+    level: f"*{icon} {level.upper()}*\n\n"
+    for level, icon in LEVEL_ICONS.items()
+}
+
+# Скільки секунд close() чекає на відправку повідомлень, що залишились у черзі
+CLOSE_TIMEOUT_SEC = 10
+
+# Повідомлення, що надійшли протягом цього вікна (секунди), об'єднуються
+# в одне, щоб серія подій давала один запит до Telegram, а не кілька
+COALESCE_WINDOW_SEC = 0.5
+
+# Максимальна довжина одного повідомлення Telegram
+TELEGRAM_MAX_MESSAGE_LEN = 4096
+
+# Тайм-аути HTTP-запитів до Telegram (секунди), щоб збій мережі не
+# блокував чергу сповіщень
+TELEGRAM_CONNECT_TIMEOUT = 3.0
+TELEGRAM_READ_TIMEOUT = 5.0
+TELEGRAM_WRITE_TIMEOUT = 5.0
+
+# Кількість спроб надсилання та базова затримка експоненційного повтору
+SEND_ATTEMPTS = 3
+SEND_RETRY_BASE_DELAY_SEC = 0.5
 
 class TelegramNotifier:
     """
@@ -19,31 +64,139 @@ class TelegramNotifier:
             return
         
         try:
-            self.bot = telegram.Bot(token=token)
+            # Повідомлення надсилає один потік, тому пулу з одного
+            # з'єднання достатньо, а паралельних рукостискань не буває
+            self.bot = telegram.Bot(
+                token=token,
+                request=HTTPXRequest(
+                    connection_pool_size=1,
+                    connect_timeout=TELEGRAM_CONNECT_TIMEOUT,
+                    read_timeout=TELEGRAM_READ_TIMEOUT,
+                    write_timeout=TELEGRAM_WRITE_TIMEOUT
+                )
+            )
             self.chat_id = chat_id
+            # Власний цикл подій на весь час життя бота: HTTP-клієнт
+            # telegram.Bot прив'язаний до циклу, тому з одним циклом пул
+            # keep-alive з'єднань до api.telegram.org використовується
+            # повторно, а не відкривається заново на кожне повідомлення
+            self._loop = asyncio.new_event_loop()
+            # Повідомлення надсилає фоновий потік, щоб мережеві затримки
+            # Telegram не блокували торговий цикл; черга зберігає порядок
+            self._queue: queue.Queue[tuple[str, str] | None] = queue.Queue()
+            self._worker = threading.Thread(
+                target=self._process_queue, name="telegram-notifier",
+                daemon=True
+            )
+            self._worker.start()
             self.logger.info("Telegram Notifier успішно ініціалізовано.")
         except Exception as e:
-            self.logger.error(f"Помилка ініціалізації Telegram Notifier: {e}")
+            self.logger.error(
+                "Помилка ініціалізації Telegram Notifier: %s", e
+            )
             self.bot = None
             self.chat_id = None
 
+    def _process_queue(self):
+        """
+        Фоновий потік: по черзі надсилає повідомлення, доки не отримає None.
+        Повідомлення, що надійшли протягом COALESCE_WINDOW_SEC, об'єднуються
+        в одне; критичні надсилаються одразу.
+        """
+        carry = []
+        while True:
+            item = carry.pop() if carry else self._queue.get()
+            if item is None:
+                return
+            level, batch = item
+            deadline = time.monotonic() + COALESCE_WINDOW_SEC
+            while level != "critical":
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None or len(batch) + 2 + len(item[1]) > \
+                        TELEGRAM_MAX_MESSAGE_LEN:
+                    carry.append(item)
+                    break
+                level = item[0]
+                batch = f"{batch}\n\n{item[1]}"
+            self._send_async_message(batch)
+
+    async def _deliver(self, message: str):
+        """
+        Надсилає повідомлення, роблячи до SEND_ATTEMPTS спроб. Якщо Telegram
+        обмежив частоту запитів (429), чекає вказаний ним час; при збоях
+        мережі чи тайм-ауті — з експоненційною затримкою.
+        """
+        for attempt in range(SEND_ATTEMPTS):
+            try:
+                await self.bot.send_message(
+                    chat_id=self.chat_id,
+                    text=message,
+                    parse_mode=ParseMode.MARKDOWN_V2
+                )
+                return
+            except BadRequest:
+                raise  # Повтор некоректного запиту не допоможе
+            except (RetryAfter, NetworkError) as e:
+                if attempt == SEND_ATTEMPTS - 1:
+                    raise
+                if isinstance(e, RetryAfter):
+                    # Нові версії python-telegram-bot повертають timedelta
+                    retry_after = e.retry_after
+                    delay = (
+                        retry_after.total_seconds()
+                        if isinstance(retry_after, timedelta)
+                        else float(retry_after)
+                    )
+                else:
+                    delay = SEND_RETRY_BASE_DELAY_SEC * 2 ** attempt
+                self.logger.warning(
+                    "Не вдалося надіслати повідомлення в Telegram (%s), "
+                    "повтор через %s с.", e, delay
+                )
+                await asyncio.sleep(delay)
+
     def _send_async_message(self, message: str):
-        """Асинхронний хелпер для надсилання повідомлення."""
-        async def main():
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode=ParseMode.MARKDOWN_V2
+        """Надсилає повідомлення через постійний цикл подій нотифікатора."""
+        try:
+            self._loop.run_until_complete(self._deliver(message))
+        except Exception as e:
+            self.logger.error(
+                "Не вдалося надіслати повідомлення в Telegram: %s", e
+            )
+
+    def close(self):
+        """
+        Дочікується відправки повідомлень з черги, після чого закриває
+        з'єднання Telegram-бота та цикл подій нотифікатора.
+        """
+        if not self.bot:
+            return
+        self._queue.put(None)
+        self._worker.join(timeout=CLOSE_TIMEOUT_SEC)
+        if self._worker.is_alive():
+            # Цикл подій досі зайнятий фоновим потоком, закрити його не можна
+            self.logger.warning(
+                "Не всі повідомлення Telegram надіслано за %s с.",
+                CLOSE_TIMEOUT_SEC
             )
-        # Використовуємо asyncio.run() для безпечного запуску async-функції
-        # з синхронного коду. Це надійніше, ніж ручне управління циклом.
+            self.bot = None
+            return
         try:
-            asyncio.run(main())
+            self._loop.run_until_complete(self.bot.shutdown())
         except Exception as e:
-            # Помилка "Event loop is closed" може виникати при частих викликах з синхронного коду.
-            # Це відома проблема, яку можна безпечно ігнорувати, перевіряючи текст помилки.
-            if "Event loop is closed" not in str(e):
-                self.logger.error(f"Не вдалося надіслати повідомлення в Telegram: {e}")
+            self.logger.warning(
+                "Помилка при закритті Telegram Notifier: %s", e
+            )
+        finally:
+            self._loop.close()
+            self.bot = None
+
     def send_message(self, text: str, level: str = "info"):
         """
         Надсилає повідомлення у вказаний чат.
@@ -54,17 +207,12 @@ class TelegramNotifier:
         if not self.bot:
             return
 
-        icons = {
-            "info": "ℹ️",
-            "success": "✅",
-            "warning": "⚠️",
-            "critical": "🔥",
-            "trade": "📈"
-        }
-        icon = icons.get(level, "ℹ️")
-        
+        header = LEVEL_HEADERS.get(level)
+        if header is None:
+            header = f"*{LEVEL_ICONS['info']} {level.upper()}*\n\n"
+
         # Екрануємо символи для MARKDOWN_V2
-        escaped_text = telegram.helpers.escape_markdown(text, version=2)
-        message = f"*{icon} {level.upper()}*\n\n{escaped_text}"
+        escaped_text = _MARKDOWN_V2_ESCAPE_RE.sub(r"\\\1", text)
+        message = header + escaped_text
 
-        self._send_async_message(message)
+        self._queue.put((level, message))
@@ -7,9 +7,10 @@
 Використовує Pydantic для надійної валідації структури JSON.
 """
 
-import json
 import logging
 from typing import List, Dict, Optional
+
+import orjson
 from pydantic import BaseModel, ValidationError
 
 
@@ -128,8 +129,9 @@ class PlanParser:
                  інакше False.
         """
         try:
-            with open(self.plan_path, "r", encoding="utf-8") as file:
-                data = json.load(file)
+            # orjson працює з байтами напряму, без проміжного декодування
+            with open(self.plan_path, "rb") as file:
+                data = orjson.loads(file.read())
 
             self.plan = TradingPlan.model_validate(data)
             self.logger.info(
@@ -147,7 +149,7 @@ class PlanParser:
             )
             return False
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             self.logger.critical(
                 "Помилка формату JSON у файлі плану: %s",
                 self.plan_path,
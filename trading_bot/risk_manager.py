@@ -3,12 +3,24 @@
 
 import logging
 from decimal import Decimal, ROUND_DOWN
+from functools import lru_cache
 
 from trading_bot.plan_parser import TradingPlan, ActiveAsset, OrderGroup, Hedge
 from trading_bot.exchange_connector import BinanceFuturesConnector
 from trading_bot.notifications import TelegramNotifier
 from trading_bot.journal import TradingJournal
 
+
+@lru_cache(maxsize=None)
+def _parse_step_size(step_size: str) -> tuple[Decimal, Decimal]:
+    """
+    Повертає крок лоту та квант округлення для рядка stepSize.
+    Кешується: stepSize для символу фактично незмінний.
+    """
+    precision = len(step_size.split('.')[1]) if '.' in step_size else 0
+    return Decimal(step_size), Decimal('1e-' + str(precision))
+
+
 class RiskManager:
     """
     Клас для управління ризиками, розрахунку розміру позицій та виконання
@@ -27,7 +39,7 @@ class RiskManager:
         balance = self.exchange.get_futures_account_balance()
         if balance is not None:
             self.equity = balance
-            self.logger.info(f"Капітал оновлено: ${self.equity:.2f}")
+            self.logger.info("Капітал оновлено: $%.2f", self.equity)
         else:
             self.logger.error("Не вдалося оновити капітал.")
 
@@ -38,15 +50,17 @@ class RiskManager:
         step_size = lot_size_filter.get('stepSize', '1')
 
         if quantity < min_qty:
-            self.logger.warning(f"Розрахована кількість {quantity} менша за мінімально дозволену {min_qty}. Ордер не буде розміщено.")
+            self.logger.warning(
+                "Розрахована кількість %s менша за мінімально дозволену %s. "
+                "Ордер не буде розміщено.", quantity, min_qty
+            )
             return None
 
-        precision = len(step_size.split('.')[1]) if '.' in step_size else 0
+        step_size_decimal, quantum = _parse_step_size(step_size)
         quantity_decimal = Decimal(str(quantity))
-        step_size_decimal = Decimal(step_size)
-        
+
         adjusted_qty = (quantity_decimal // step_size_decimal) * step_size_decimal
-        return float(adjusted_qty.quantize(Decimal('1e-' + str(precision)), rounding=ROUND_DOWN))
+        return float(adjusted_qty.quantize(quantum, rounding=ROUND_DOWN))
 
 
     def calc_qty(self, asset: ActiveAsset, order_group: OrderGroup, oco: bool = True) -> float | None:
@@ -54,14 +68,20 @@ class RiskManager:
         Новий алгоритм розрахунку розміру позиції з урахуванням маржі, плеча, OCO, і автоматичного зменшення qty при -2019.
         oco=True означає, що враховується double margin (дві сторони OCO).
         """
-        self.logger.info(f"[NEW] Розрахунок розміру позиції для {asset.symbol} (OCO={oco})...")
+        self.logger.info(
+            "[NEW] Розрахунок розміру позиції для %s (OCO=%s)...",
+            asset.symbol, oco
+        )
         self.update_equity()
         if self.equity <= 0:
             self.logger.error("Капітал дорівнює нулю або не визначений. Розрахунок неможливий.")
             return None
 
         risk_per_trade_usd = self.equity * self.plan.risk_budget
-        self.logger.info(f"Загальний капітал: ${self.equity:.2f}, Ризик на угоду: ${risk_per_trade_usd:.2f}")
+        self.logger.info(
+            "Загальний капітал: $%.2f, Ризик на угоду: $%.2f",
+            self.equity, risk_per_trade_usd
+        )
 
         # Визначаємо ціну входу в залежності від типу ордера
         if "LIMIT" in order_group.order_type.upper():
@@ -90,19 +110,30 @@ class RiskManager:
         margin_limit = self.equity * 0.95
         if required_margin > margin_limit:
             self.logger.warning(
-                f"[NEW] Позиція для {asset.symbol} вимагає занадто багато маржі! Необхідно: ${required_margin:.2f}, Ліміт: ${margin_limit:.2f}. Qty буде зменшено.")
+                "[NEW] Позиція для %s вимагає занадто багато маржі! "
+                "Необхідно: $%.2f, Ліміт: $%.2f. Qty буде зменшено.",
+                asset.symbol, required_margin, margin_limit
+            )
             # Автоматичне зменшення qty до максимальної допустимої маржі
             max_qty = (margin_limit / (2 if oco else 1)) * asset.leverage / entry_price
             quantity = min(quantity, max_qty)
-            self.logger.info(f"[NEW] Qty скориговано до {quantity:.6f} через margin guard.")
+            self.logger.info(
+                "[NEW] Qty скориговано до %.6f через margin guard.", quantity
+            )
 
         filters = self.exchange.get_exchange_filters(asset.symbol)
         if not filters:
-            self.logger.error(f"Не вдалося отримати фільтри для {asset.symbol}, неможливо скоригувати кількість.")
+            self.logger.error(
+                "Не вдалося отримати фільтри для %s, неможливо скоригувати "
+                "кількість.", asset.symbol
+            )
             return None
         adj_qty = self._adjust_quantity_to_filters(quantity, filters)
         if adj_qty is None or adj_qty <= 0:
-            self.logger.error(f"[NEW] Скоригована кількість {adj_qty} недійсна. Ордер не буде розміщено.")
+            self.logger.error(
+                "[NEW] Скоригована кількість %s недійсна. "
+                "Ордер не буде розміщено.", adj_qty
+            )
             return None
         return adj_qty
 
@@ -124,11 +155,11 @@ class RiskManager:
     
     def handle_monitoring_action(self, action: str, position: dict, asset_plan: ActiveAsset): 
         """Обробляє дії моніторингу (поки заглушка)."""
-        self.logger.info(f"Дія моніторингу '{action}' не реалізована.")
+        self.logger.info("Дія моніторингу '%s' не реалізована.", action)
     
     def execute_risk_action(self, action: str): 
         """Виконує ризикові дії (поки заглушка)."""
-        self.logger.info(f"Ризикова дія '{action}' не реалізована.")
+        self.logger.info("Ризикова дія '%s' не реалізована.", action)
     
     def _close_all_long_positions(self, keep_hedge: bool): 
         """Закриває всі лонг позиції (поки заглушка)."""
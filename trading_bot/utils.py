@@ -24,7 +24,7 @@ def get_exchange_filters(client, symbol: str) -> dict:
                     filters[f['filterType']] = f
                 return filters
     except Exception as e:
-        logging.error(f"Не вдалося отримати фільтри для {symbol}: {e}")
+        logging.error("Не вдалося отримати фільтри для %s: %s", symbol, e)
     return {}
 
 def calculate_atr(klines: list, length: int = 14) -> float | None:
@@ -35,7 +35,10 @@ def calculate_atr(klines: list, length: int = 14) -> float | None:
     :return: Останнє значення ATR або None у разі помилки.
     """
     if not klines or len(klines) < length:
-        logging.warning(f"Недостатньо даних для розрахунку ATR (потрібно {length}, отримано {len(klines)}).")
+        logging.warning(
+            "Недостатньо даних для розрахунку ATR (потрібно %s, отримано %s).",
+            length, len(klines) if klines else 0
+        )
         return None
     
     try:
@@ -55,5 +58,5 @@ def calculate_atr(klines: list, length: int = 14) -> float | None:
         last_atr = df[f'ATRr_{length}'].iloc[-1]
         return float(last_atr)
     except Exception as e:
-        logging.error(f"Помилка при розрахунку ATR: {e}")
+        logging.error("Помилка при розрахунку ATR: %s", e)
         return None